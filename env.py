@@ -5,6 +5,8 @@ from dataclasses import dataclass
 
 load_dotenv()  # Carrega variáveis do .env
 
+PLACEMENTS = ('round_robin', 'free_space')  # Estratégias de distribuição do armazenamento local
+
 def _is_valid_uri(uri: str) -> bool:
     from pymongo.uri_parser import parse_uri, InvalidURI
     try:
@@ -22,6 +24,14 @@ def _validate_required(var_name: str, validator=lambda x: bool(x)) -> str | int:
     return value
 
 
+def _validate_choice(var_name: str, choices: tuple[str, ...], default: str) -> str:
+    value = os.getenv(var_name, default)
+    if value not in choices:
+        print(f'[ENV] Erro: a variável "{var_name}" deve ser uma de: {", ".join(choices)}.')
+        sys.exit(1)
+    return value
+
+
 @dataclass
 class Env:
     '''
@@ -33,6 +43,9 @@ class Env:
     MONGO_URI: str | None = None
     CLUSTERS: dict[str, str] | None = None
 
+    UPLOAD_DIRS: list[str] | None = None
+    UPLOAD_PLACEMENT: str = 'round_robin'
+
 
     @classmethod
     def load(cls) -> 'Env':
@@ -41,11 +54,18 @@ class Env:
             for key, value in os.environ.items()
             if key.startswith('MONGO_URI_FILES_') and value and _is_valid_uri(value)
         }
+        upload_dirs = [
+            path.strip()
+            for path in os.getenv('UPLOAD_DIRS', './uploads').split(',')
+            if path.strip()
+        ]
         return cls(
             AUTHORIZATION_TOKEN=_validate_required('AUTHORIZATION'),
             MAX_FILE_SIZE=_validate_required('MAX_FILE_SIZE'),
             MONGO_URI=os.getenv('MONGO_URI'),
-            CLUSTERS=mongo_files
+            CLUSTERS=mongo_files,
+            UPLOAD_DIRS=upload_dirs,
+            UPLOAD_PLACEMENT=_validate_choice('UPLOAD_PLACEMENT', PLACEMENTS, 'round_robin')
         )
 
 ENV = Env.load()
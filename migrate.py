@@ -0,0 +1,28 @@
+if __name__ == '__main__':
+    import os
+    import sys
+    import sqlite3
+    from contextlib import closing
+
+    from env import ENV
+    from src.database.storage import LocalStorage
+
+    # Diretórios antigos que não estão mais em UPLOAD_DIRS, ex.: python migrate.py ./uploads
+    sources = sys.argv[1:]
+
+    if not os.path.exists('metadata.db'):
+        print('Banco de metadados "metadata.db" não encontrado, nada para migrar.')
+        sys.exit(1)
+
+    with closing(sqlite3.connect('metadata.db')) as conn:
+        file_ids = {row[0] for row in conn.execute('SELECT id FROM File')}
+
+    storage = LocalStorage(ENV.UPLOAD_DIRS, ENV.UPLOAD_PLACEMENT)
+    report = storage.migrate(file_ids, sources)
+
+    print(f'{report["migrated"]} arquivo(s) migrado(s) para o layout particionado.')
+    print(f'{report["removed_temp_files"]} arquivo(s) temporário(s) removido(s).')
+    if report['skipped']:
+        print(f'{len(report["skipped"])} arquivo(s) ignorado(s) por não estarem cadastrados no banco:')
+        for path in report['skipped']:
+            print(f'  - {path}')
\ No newline at end of file
@@ -38,7 +38,11 @@ class UploadFileInfo:
 class GetAllFilesInfo:
     name: str = 'Get Files'
     tags: list[str] = ['Files']
-    description: str = 'Retorna uma lista contendo todos os metadados dos arquivos armazenados.'
+    description: str = (
+        'Retorna uma lista contendo todos os metadados dos arquivos armazenados.\n\n'
+        'Para listagens grandes, use `?format=ndjson` (um JSON por linha) ou `?format=json-seq` (RFC 7464) '
+        'para receber os registros em streaming, conforme são lidos do banco de dados.'
+    )
     responses: dict = {
         200: {
             'description': 'Lista de arquivos com seus metadados.',
@@ -54,7 +58,9 @@ class GetAllFilesInfo:
                             'url': 'http://127.0.0.1/files/365952d5-3295-475d-9ba4-ac4d080bab0b.png'
                         }
                     ]
-                }
+                },
+                'application/x-ndjson': {},
+                'application/json-seq': {}
             }
         },
         401: {'description': 'Token de autorização inválido.'}
@@ -1,7 +1,9 @@
 import os
+import orjson
+from typing import Iterator, Literal
 from uuid import uuid4
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Header, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Header, Request, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from src.database import DatabaseClient
 from .docs import (
@@ -19,9 +21,20 @@ from src.schemas.file import (
 
 from env import ENV
 
-router = APIRouter(prefix='/files')
+router = APIRouter(prefix='/files', default_response_class=ORJSONResponse)
 database = DatabaseClient()
 
+# Formatos de streaming da listagem: (media type, prefixo, separador) de cada registro
+STREAM_FORMATS: dict[str, tuple[str, bytes, bytes]] = {
+    'ndjson': ('application/x-ndjson', b'', b'\n'),
+    'json-seq': ('application/json-seq', b'\x1e', b'\n'),  # RFC 7464
+}
+
+def _serialize_records(records: Iterator[dict], prefix: bytes, separator: bytes) -> Iterator[bytes]:
+    """Serializa cada registro assim que ele é produzido pelo banco."""
+    for record in records:
+        yield prefix + orjson.dumps(record) + separator
+
 @router.get('/clusters', response_model=list[ClustersInfoResponse], **ClustersInfo.to_dict())
 async def get_clusters_status(auth: str = Header()):
     """Retorna as informações de todas as cluster, se o armazenamento for local retorna None"""
@@ -31,16 +44,23 @@ async def get_clusters_status(auth: str = Header()):
     try:
         if ENV.CLUSTERS:
             status = await database.files.get_clusters_status()
-            return JSONResponse(content=status)
-        return JSONResponse(status_code=404, content='Não é possível obter o status no armazenamento local.')
+            return ORJSONResponse(content=status)
+        return ORJSONResponse(status_code=404, content='Não é possível obter o status no armazenamento local.')
     except Exception as e:
-        return HTTPException(status_code=500, detail=f'Erro ao obter o status das clusters: {str(e)}')
+        raise HTTPException(status_code=500, detail=f'Erro ao obter o status das clusters: {str(e)}')
 
 @router.get('/', response_model= list[FileResponse], **GetAllFilesInfo.to_dict())
-async def file_list():
+async def file_list(output: Literal['json', 'ndjson', 'json-seq'] = Query('json', alias='format')):
     """Retorna a lista de todos os metadados armazenados"""
+    if output in STREAM_FORMATS:
+        media_type, prefix, separator = STREAM_FORMATS[output]
+        return StreamingResponse(
+            _serialize_records(database.files.iter_files(), prefix, separator),
+            media_type=media_type
+        )
+
     files = await database.files.list_files()
-    return JSONResponse(content=files)
+    return ORJSONResponse(content=files)
 
 @router.post('/upload', response_model=list[UploadResponse], **UploadFileInfo.to_dict())
 async def upload_file(request: Request, file: UploadFile = File(), auth: str = Header(), filename: str = Form(None)):
@@ -62,7 +82,7 @@ async def upload_file(request: Request, file: UploadFile = File(), auth: str = H
         base_url
     )
 
-    return JSONResponse(content=response)
+    return ORJSONResponse(content=response)
 
 @router.get('/{file_id}', **GetFileInfo.to_dict())
 async def get_file(file_id: str):
@@ -1,10 +1,11 @@
+from typing import Iterator
 from pymongo import MongoClient
 from pymongo.database import Database
-from gridfs import GridFS
+from gridfs import GridFS, GridOut
 from io import BytesIO
 
 from env import ENV
-from .utils import convert_size
+from .utils import convert_size, format_upload_date
 
 class MongoFiles:
     def __init__(self) -> None:
@@ -32,6 +33,17 @@ class MongoFiles:
         self.db = self.client[self.db_name]
         self.fs = GridFS(self.db)
 
+    def _get_file_info(self, file: GridOut) -> dict:
+        """Monta os metadados de um arquivo do GridFS."""
+        return {
+            'file_id': str(file._id),
+            'filename': file.filename,
+            'mimetype': file.content_type,
+            'size': file.length,
+            'upload_date': format_upload_date(file.upload_date),
+            'url': file.url
+        }
+
     def _get_file_from_cluster(self, file_id: str, cluster_uri: str) -> dict | None:
         """Pega um arquivo do cluster."""
         client = MongoClient(cluster_uri)
@@ -41,15 +53,7 @@ class MongoFiles:
         try:
             file = fs.find_one({'_id': file_id})
             if file:
-                file_info = {
-                    'file_id': str(file._id),
-                    'filename': file.filename,
-                    'mimetype': file.content_type,
-                    'size': file.length,
-                    'upload_date': file.upload_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': file.url
-                }
-                return file_info, file
+                return self._get_file_info(file), file
         except Exception:
             pass
         return None, None
@@ -69,7 +73,8 @@ class MongoFiles:
         result = db.fs.files.aggregate([
             {'$group': {'_id': '$contentType', 'count': {'$sum': 1}}}
         ])
-        return {item['_id']: item['count'] for item in result}
+        # Arquivos sem `contentType` são agrupados como `None`, que não é uma chave JSON válida
+        return {item['_id'] or 'unknown': item['count'] for item in result}
     
     def upload_file(self, file_id: str,  filename: str, content_type: str, file_data: bytes, base_url: str) -> dict:
         """Faz o upload de um arquivo para um cluster.
@@ -114,22 +119,17 @@ class MongoFiles:
                 pass
         return False
     
-    async def list_files(self) -> list[dict]:
-        all_files = []
+    def iter_files(self) -> Iterator[dict]:
+        """Gera os metadados dos arquivos conforme os cursores das clusters os retornam."""
         for _, uri in self.clusters.items():
-            client = MongoClient(uri)
-            db = client[self.db_name]
-            fs = GridFS(db)
-            for file in fs.find():
-                all_files.append({
-                    'file_id': str(file._id),
-                    'filename': file.filename,
-                    'mimetype': file.content_type,
-                    'size': file.length,
-                    'upload_date': file.upload_date.strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': file.url 
-                })
-        return all_files
+            with MongoClient(uri) as client:
+                fs = GridFS(client[self.db_name])
+                for file in fs.find():
+                    yield self._get_file_info(file)
+
+    async def list_files(self) -> list[dict]:
+        """Lista todos os arquivos de todas as clusters."""
+        return list(self.iter_files())
     
     async def get_clusters_status(self) -> list[dict]:
         """Pega o status de todos os clusters."""
@@ -1,27 +1,42 @@
 import sqlite3
+from contextlib import closing
+from typing import Iterator
 from io import BytesIO
 from pathlib import Path
 
-from .utils import get_file_path, get_file_size
+from env import ENV
+from .storage import LocalStorage
+from .utils import get_file_size, format_upload_date
+
+# Ordem das colunas esperada por `_get_file_info`
+FILE_COLUMNS = 'id, filename, mimetype, size, createdAt, url'
 
 class SQLiteFiles:
     def __init__(self) -> None:
-        self.upload_dir = Path('./uploads')
-        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        self.storage = LocalStorage(ENV.UPLOAD_DIRS, ENV.UPLOAD_PLACEMENT)
 
         self.db_path = Path('./metadata.db')
         self.conn = sqlite3.connect(self.db_path)
 
         self.max_size = 100 * 1024 * 1024  # 100MB
+
+    def _get_file_info(self, row: tuple) -> dict:
+        """Monta os metadados de um arquivo a partir de uma linha da tabela `File`."""
+        return {
+            'file_id': row[0],
+            'filename': row[1],
+            'mimetype': row[2],
+            'size': row[3],
+            'upload_date': format_upload_date(row[4]),
+            'url': row[5]
+        }
     
     def upload_file(self, file_id: str, filename: str, content_type: str, file_data: bytes, base_url: str) -> dict:
         """Faz o upload de um arquivo enviando os metadados para o SQLite."""
         if len(file_data) > self.max_size:
             raise Exception('Arquivo excede o limite de tamanho permitido.')
         
-        path = get_file_path(file_id)
-        with open(path, 'wb') as f:
-            f.write(file_data)
+        path = self.storage.write(file_id, file_data)
 
         cursor = self.conn.cursor()
         cursor.execute('''
@@ -38,20 +53,11 @@ class SQLiteFiles:
     def get_file(self, file_id: str) -> tuple[dict, object] | None:
         """Pega os metadados de um arquivo do SQLite."""
         cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM File WHERE id = ?', (file_id,))
+        cursor.execute(f'SELECT {FILE_COLUMNS} FROM File WHERE id = ?', (file_id,))
         result = cursor.fetchone()
         if result:
-            path = get_file_path(file_id)
-            with open(path, 'rb') as file:
-                content = file.read()
-            return {
-                'file_id': result[0],
-                'filename': result[1],
-                'mimetype': result[2],
-                'size': result[3],
-                'upload_date': result[4],
-                'url': result[5]
-            }, BytesIO(content)
+            content = self.storage.read(file_id)
+            return self._get_file_info(result), BytesIO(content)
         return None
     
     def delete_file(self, file_id: str) -> bool:
@@ -60,27 +66,23 @@ class SQLiteFiles:
         if not file:
             return False
         
-        try:
-            path = get_file_path(file_id)
-            path.unlink()
-        except FileNotFoundError:
-            pass
+        self.storage.delete(file_id)
 
         cursor = self.conn.cursor()
         cursor.execute('DELETE FROM File WHERE id = ?', (file_id,))
         self.conn.commit()
         return True
     
+    def iter_files(self) -> Iterator[dict]:
+        """Gera os metadados dos arquivos conforme o cursor do SQLite os retorna.
+
+        Usa uma conexão própria, pois o gerador pode ser consumido fora da thread que criou `self.conn`.
+        """
+        with closing(sqlite3.connect(self.db_path, check_same_thread=False)) as conn:
+            cursor = conn.execute(f'SELECT {FILE_COLUMNS} FROM File')
+            for row in cursor:
+                yield self._get_file_info(row)
+
     async def list_files(self) -> list[dict]:
         """Lista todos os arquivos do SQLite"""
-        cursor = self.conn.cursor()
-        cursor.execute('SELECT * FROM File')
-        result = cursor.fetchall()
-        return [{
-            'file_id': row[0],
-            'filename': row[1],
-            'mimetype': row[2],
-            'size': row[3],
-            'upload_date': row[4],
-            'url': row[5]
-        } for row in result]
\ No newline at end of file
+        return list(self.iter_files())
@@ -0,0 +1,165 @@
+import os
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+
+from env import PLACEMENTS
+
+TEMP_PREFIX = '.tmp-'
+
+class LocalStorage:
+    """Armazenamento local dos arquivos, distribuído entre um ou mais diretórios raiz.
+
+    Cada arquivo é salvo em `<raiz>/<aa>/<bb>/<file_id>`, onde `aa` e `bb` são os primeiros
+    caracteres do hash SHA-1 do `file_id`, evitando diretórios com centenas de milhares de entradas.
+    """
+    def __init__(self, roots: list[str], placement: str = 'round_robin') -> None:
+        if not roots:
+            raise ValueError('É necessário informar ao menos um diretório de uploads.')
+        if placement not in PLACEMENTS:
+            raise ValueError(f'Estratégia de distribuição inválida: "{placement}". Use uma de: {", ".join(PLACEMENTS)}.')
+
+        self.roots: list[Path] = [Path(root) for root in roots]
+        self.placement: str = placement
+        self._next_root: int = 0
+
+        for root in self.roots:
+            root.mkdir(parents=True, exist_ok=True)
+
+    def _shard_path(self, root: Path, file_id: str) -> Path:
+        """Monta o caminho particionado de um arquivo dentro de uma raiz."""
+        digest = hashlib.sha1(file_id.encode()).hexdigest()
+        return root / digest[:2] / digest[2:4] / file_id
+
+    def _choose_root(self) -> Path:
+        """Escolhe a raiz que receberá o próximo arquivo."""
+        if self.placement == 'free_space':
+            return max(self.roots, key=lambda root: shutil.disk_usage(root).free)
+
+        root = self.roots[self._next_root % len(self.roots)]
+        self._next_root += 1
+        return root
+
+    def _fsync_dir(self, directory: Path) -> None:
+        """Garante que a renomeação no diretório foi persistida (não suportado no Windows)."""
+        if os.name == 'nt':
+            return
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _make_dirs(self, directory: Path) -> None:
+        """Cria um diretório e seus pais, persistindo a entrada de cada diretório novo no pai."""
+        created = []
+        current = directory
+        while not current.exists():
+            created.append(current)
+            current = current.parent
+
+        directory.mkdir(parents=True, exist_ok=True)
+        for path in reversed(created):
+            self._fsync_dir(path.parent)
+
+    def find(self, file_id: str) -> Path | None:
+        """Procura um arquivo em todas as raízes, incluindo o layout antigo (`<raiz>/<file_id>`)."""
+        for root in self.roots:
+            path = self._shard_path(root, file_id)
+            if path.is_file():
+                return path
+        for root in self.roots:
+            path = root / file_id
+            if path.is_file():
+                return path
+        return None
+
+    def write(self, file_id: str, file_data: bytes) -> Path:
+        """Salva um arquivo de forma atômica (arquivo temporário + fsync + rename)."""
+        path = self._shard_path(self._choose_root(), file_id)
+        self._make_dirs(path.parent)
+
+        # O temporário fica no mesmo diretório para que o rename não cruze sistemas de arquivos
+        fd, tmp_path = tempfile.mkstemp(prefix=TEMP_PREFIX, dir=path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(file_data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o644)  # mkstemp cria o arquivo com permissão 0600
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self._fsync_dir(path.parent)
+        return path
+
+    def read(self, file_id: str) -> bytes:
+        """Lê o conteúdo de um arquivo.
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existir em nenhuma raiz.
+        """
+        path = self.find(file_id)
+        if not path:
+            raise FileNotFoundError(f'Arquivo "{file_id}" não encontrado no armazenamento local')
+        return path.read_bytes()
+
+    def delete(self, file_id: str) -> bool:
+        """Deleta um arquivo, retornando se ele existia."""
+        path = self.find(file_id)
+        if not path:
+            return False
+        path.unlink(missing_ok=True)
+        return True
+
+    def _remove_stale_temp_files(self, root: Path) -> int:
+        """Remove os temporários deixados por gravações interrompidas dentro de uma raiz."""
+        removed = 0
+        for pattern in (f'{TEMP_PREFIX}*', f'*/*/{TEMP_PREFIX}*'):
+            for path in root.glob(pattern):
+                if path.is_file():
+                    path.unlink(missing_ok=True)
+                    removed += 1
+        return removed
+
+    def migrate(self, file_ids: set[str], sources: list[str] | None = None) -> dict:
+        """Move os arquivos do layout antigo (`<diretório>/<file_id>`) para o layout particionado.
+
+        Apenas arquivos cujo nome está em `file_ids` são migrados. Arquivos nas raízes
+        permanecem na mesma raiz (apenas um rename); arquivos de `sources`, diretórios que não
+        fazem mais parte de `UPLOAD_DIRS`, são copiados para uma das raízes e removidos da origem.
+        Também remove temporários de gravações interrompidas, portanto não deve ser executado
+        com o servidor no ar.
+
+        Retorna o número de arquivos migrados, os arquivos ignorados e os temporários removidos.
+        """
+        report = {'migrated': 0, 'skipped': [], 'removed_temp_files': 0}
+
+        for root in self.roots:
+            report['removed_temp_files'] += self._remove_stale_temp_files(root)
+
+        directories = [(root, True) for root in self.roots]
+        directories += [(Path(source), False) for source in sources or []]
+        for directory, is_root in directories:
+            for entry in sorted(directory.iterdir()):
+                if not entry.is_file():
+                    continue
+                if entry.name.startswith('.') or entry.name not in file_ids:
+                    report['skipped'].append(entry)
+                    continue
+
+                if is_root:
+                    path = self._shard_path(directory, entry.name)
+                    self._make_dirs(path.parent)
+                    os.replace(entry, path)
+                    self._fsync_dir(path.parent)
+                else:
+                    self.write(entry.name, entry.read_bytes())
+                    entry.unlink()
+                report['migrated'] += 1
+
+            self._fsync_dir(directory)
+        return report
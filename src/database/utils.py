@@ -1,14 +1,18 @@
+from datetime import datetime
 from pathlib import Path
 
-upload_dir = Path('./uploads')
-upload_dir.mkdir(parents=True, exist_ok=True)
-
-def get_file_path(file_id: str) -> Path:
-    return upload_dir / file_id
-
 def get_file_size(file_path: Path) -> int:
     return file_path.stat().st_size
 
+def format_upload_date(upload_date: datetime | str) -> str:
+    """Formata a data de upload no padrão `YYYY-MM-DD HH:MM:SS`.
+
+    O SQLite já devolve a data como texto nesse formato, então ela é repassada sem alterações.
+    """
+    if isinstance(upload_date, datetime):
+        return upload_date.isoformat(sep=' ', timespec='seconds')
+    return upload_date
+
 def convert_size(size_bytes: int) -> str:
     """Converte bytes para string legível (MB, KB, GB etc.)."""
     if size_bytes == 0: